@@ -6,45 +6,47 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
 from .api import ElectroCarsAPI
 from .coordinator import ElectroCarsCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["sensor", "device_tracker", "binary_sensor", "button"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api = ElectroCarsAPI(entry)
-    await api.initialize(hass, entry)
-    coordinator = ElectroCarsCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await api.initialize(hass, entry)
+        coordinator = ElectroCarsCoordinator(hass, api)
+        await coordinator.async_config_entry_first_refresh()
+    except BaseException:
+        # Setup is retried with a fresh API object, don't leave the old session behind
+        await api.close()
+        raise
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "device_tracker", "binary_sensor", "button"])
-
-    # async def handle_send_command(call):
-    #     """Handle the service call to send a command."""
-    #     imei = call.data.get("imei")
-    #     command = call.data.get("command")
-    #     if not imei or command is None:
-    #         _LOGGER.error("Missing required parameters: imei and command")
-    #         return
-    #
-    #     success = await coordinator.api.send_command(imei, command)
-    #     if not success:
-    #         _LOGGER.error("Failed to send command %s to device %s", command, imei)
-    #
-    # hass.services.async_register(
-    #     DOMAIN,
-    #     "send_command",
-    #     handle_send_command,
-    # )
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator: ElectroCarsCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
-    await coordinator.api.close()
-    return await hass.config_entries.async_unload_platforms(entry, ["sensor", "device_tracker", "binary_sensor"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        coordinator: ElectroCarsCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        await coordinator.api.close()
+    return unload_ok
@@ -1,7 +1,14 @@
+import asyncio
 import aiohttp
 import async_timeout
+import functools
 import logging
-from typing import Optional
+import time
+from typing import Any, Optional
+
+from homeassistant.util.json import json_loads
+
+from .util import DEVICE_INFO_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -9,6 +16,45 @@ AUTH_BASE = "https://fleet-gateway.technotrek.ru/api/auth"
 FLEET_BASE = "https://fleet-api.technotrek.ru"
 APP_ID = "7542fd74-47bd-4652-b422-6ef7d610582e"
 
+# Payloads larger than this are decoded in the executor to keep the event loop responsive
+EXECUTOR_DECODE_THRESHOLD = 64 * 1024
+
+
+@functools.cache
+def projection_fields() -> tuple[frozenset[str], frozenset[str]]:
+    """Return the car and telematics fields read by the platforms.
+
+    Entities read ``telematics.get(key, car.get(key))``, so every entity key is kept at both levels.
+    """
+    # Imported here, the platforms import this module through the coordinator
+    from .binary_sensor import BINARY_SENSOR_TYPES
+    from .sensor import SENSOR_TYPES
+
+    entity_keys = {description.key for description in (*SENSOR_TYPES, *BINARY_SENSOR_TYPES)}
+    entity_keys.add("imei")
+    return frozenset(entity_keys.union(DEVICE_INFO_KEYS)), frozenset(entity_keys)
+
+
+def _project_car(
+    car: dict[str, Any], car_fields: frozenset[str], telematics_fields: frozenset[str]
+) -> dict[str, Any]:
+    """Keep only the car and telematics fields used by the platforms."""
+    projected = {key: value for key, value in car.items() if key in car_fields}
+    telematics = car.get("telematics")
+    if telematics:
+        projected["telematics"] = [
+            {key: value for key, value in telematics[0].items() if key in telematics_fields}
+        ]
+    return projected
+
+
+def decode_cars(raw: bytes) -> list[dict[str, Any]]:
+    """Decode a /car response body into a list of projected cars."""
+    car_fields, telematics_fields = projection_fields()
+    items = json_loads(raw)["result"]["items"]
+    return [_project_car(car, car_fields, telematics_fields) for car in items]
+
+
 class ElectroCarsAPI:
     def __init__(self, entry: Optional["ConfigEntry"] = None):
         self._access_token = None
@@ -16,13 +62,16 @@ class ElectroCarsAPI:
         self._phone = None
         self._session: Optional[aiohttp.ClientSession] = None
         self._entry = entry
+        self._hass = None
+        self._refresh_lock = asyncio.Lock()
+        self.last_decode_duration: Optional[float] = None
 
     async def _ensure_session(self):
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession()
 
     async def initialize(self, hass, entry):
-        self._session = aiohttp.ClientSession()
+        await self._ensure_session()
         self._entry = entry
         self._phone = entry.data.get("phone")
         self._refresh_token = entry.data.get("refresh_token")
@@ -73,7 +122,15 @@ class ElectroCarsAPI:
                 _LOGGER.error("Login failed response body: %s", text)
                 return None
 
-    async def refresh_access_token(self, hass) -> bool:
+    async def refresh_access_token(self, hass, failed_token: Optional[str] = None) -> bool:
+        # Concurrent commands may all hit an expired token, only refresh once for all of them.
+        # failed_token is the token the rejected request was sent with.
+        async with self._refresh_lock:
+            if failed_token is not None and self._access_token != failed_token:
+                return True
+            return await self._refresh_access_token(hass)
+
+    async def _refresh_access_token(self, hass) -> bool:
         await self._ensure_session()
         async with async_timeout.timeout(10):
             async with self._session.post(
@@ -93,14 +150,11 @@ class ElectroCarsAPI:
                     if "refresh_token" in cookies:
                         self._refresh_token = cookies["refresh_token"].value
                         if self._entry:
-                            async def _save_refresh_token():
-                                new_data = {**self._entry.data, "refresh_token": self._refresh_token}
-                                hass.config_entries.async_update_entry(
-                                    self._entry,
-                                    data=new_data,
-                                )
-
-                            hass.async_create_task(_save_refresh_token())
+                            # async_update_entry is a callback, so save directly instead of spawning a task
+                            hass.config_entries.async_update_entry(
+                                self._entry,
+                                data={**self._entry.data, "refresh_token": self._refresh_token},
+                            )
                     else:
                         _LOGGER.warning("Refresh response did not include a new refresh_token.")
                     _LOGGER.info("Access token refreshed")
@@ -109,53 +163,75 @@ class ElectroCarsAPI:
                 _LOGGER.error("Failed to refresh token: %s", text)
                 return False
 
-    async def get_cars(self) -> Optional[list]:
+    async def get_cars(self, _retried: bool = False) -> Optional[list]:
         await self._ensure_session()
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        token = self._access_token
+        headers = {"Authorization": f"Bearer {token}"}
         async with async_timeout.timeout(10):
             async with self._session.get(f"{FLEET_BASE}/car?limit=100&offset=0&filter=%5B%5D", headers=headers) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    return data["result"]["items"]
-                elif resp.status == 401:
+                    raw = await resp.read()
+                    return await self._decode_cars(raw)
+                elif resp.status == 401 and not _retried:
                     _LOGGER.warning("Access token invalid, trying to refresh...")
-                    if await self.refresh_access_token(self._hass):
-                        return await self.get_cars()
+                    if await self.refresh_access_token(self._hass, token):
+                        return await self.get_cars(_retried=True)
                 text = await resp.text()
                 _LOGGER.error("Failed to get cars: %s", text)
                 return None
 
-    async def get_commands(self, imei: str) -> Optional[list]:
+    async def _decode_cars(self, raw: bytes) -> list:
+        """Decode the cars payload, off the event loop when it is large."""
+        start = time.perf_counter()
+        # Resolve the fields on the loop, the platform imports must not run in the executor
+        projection_fields()
+        if self._hass is not None and len(raw) > EXECUTOR_DECODE_THRESHOLD:
+            cars = await self._hass.async_add_executor_job(decode_cars, raw)
+        else:
+            cars = decode_cars(raw)
+        self.last_decode_duration = time.perf_counter() - start
+        _LOGGER.debug(
+            "Decoded %d cars (%d bytes) in %.1f ms",
+            len(cars), len(raw), self.last_decode_duration * 1000,
+        )
+        return cars
+
+    async def get_commands(self, imei: str, _retried: bool = False) -> Optional[list]:
         """Get list of available commands for a specific device."""
         await self._ensure_session()
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        token = self._access_token
+        headers = {"Authorization": f"Bearer {token}"}
         async with async_timeout.timeout(10):
             async with self._session.get(f"{FLEET_BASE}/telematics/devices/{imei}/commands", headers=headers) as resp:
                 if resp.status == 200:
                     data = await resp.json()
                     return data["result"]
-                elif resp.status == 500:
+                elif resp.status == 500 and not _retried:
                     _LOGGER.warning("Access token invalid, trying to refresh...")
-                    if await self.refresh_access_token(self._hass):
-                        return await self.get_commands(imei)
+                    if await self.refresh_access_token(self._hass, token):
+                        return await self.get_commands(imei, _retried=True)
                 text = await resp.text()
                 _LOGGER.error("Failed to get commands: %s", text)
                 return None
 
-    async def send_command(self, imei: str, command: int) -> bool:
-        """Send a specific command to the device."""
+    async def send_command(self, imei: str, command: int, timeout: float = 10, _retried: bool = False) -> bool:
+        """Send a specific command to the device.
+
+        Only one retry is made after a token refresh, an offline unit keeps answering 500.
+        """
         await self._ensure_session()
-        headers = {"Authorization": f"Bearer {self._access_token}"}
+        token = self._access_token
+        headers = {"Authorization": f"Bearer {token}"}
         payload = {"command": command}
-        async with async_timeout.timeout(10):
+        async with async_timeout.timeout(timeout):
             async with self._session.post(f"{FLEET_BASE}/telematics/devices/{imei}/commands", headers=headers, json=payload) as resp:
                 if resp.status == 200:
                     _LOGGER.info("Command %s sent successfully to device %s", command, imei)
                     return True
-                elif resp.status == 500:
+                elif resp.status == 500 and not _retried:
                     _LOGGER.warning("Access token invalid, trying to refresh...")
-                    if await self.refresh_access_token(self._hass):
-                        return await self.send_command(imei, command)
+                    if await self.refresh_access_token(self._hass, token):
+                        return await self.send_command(imei, command, timeout, _retried=True)
                 text = await resp.text()
                 _LOGGER.error("Failed to send command: %s", text)
                 return False
@@ -163,3 +239,4 @@ class ElectroCarsAPI:
     async def close(self):
         if self._session:
             await self._session.close()
+            self._session = None
@@ -3,13 +3,13 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorEntityDescription
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import ElectroCarsCoordinator
+from .entity import ElectroCarEntity
 from .util import build_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,7 +58,7 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
-class ElectroCarBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ElectroCarBinarySensor(ElectroCarEntity, BinarySensorEntity):
     def __init__(self, coordinator: ElectroCarsCoordinator, car_id, description, device_info):
         super().__init__(coordinator)
         self.coordinator = coordinator
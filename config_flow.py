@@ -142,4 +142,8 @@ class ElectroCarsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if self._phone:
             data["phone"] = self._phone
 
+        # The entry creates its own API client, release the one used for login
+        await self._api.close()
+        self._api = None
+
         return self.async_create_entry(title="Electro Cars", data=data)
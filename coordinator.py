@@ -1,12 +1,40 @@
+import asyncio
 import datetime
 import logging
+import time
+from collections import deque
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+import aiohttp
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ElectroCarsAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+# Consecutive failed refreshes before the circuit breaker opens
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = datetime.timedelta(minutes=2)
+BREAKER_MAX_BACKOFF = datetime.timedelta(hours=1)
+
+# Poll near the moment a charging car reaches one of these SoC levels
+CHARGE_THRESHOLDS = (80, 100)
+CHARGE_SAMPLES = 6
+# Upper bound on charging power, keeps a noisy SoC rate from scheduling polls too early
+MAX_CHARGING_POWER_KW = 150
+MIN_INTERVAL = datetime.timedelta(minutes=1)
+# Most trips are short, poll every minute right after a trip starts and back off on long trips.
+# The end of a long trip is then caught within MOVING_INTERVAL rather than a minute.
+TRIP_START_WINDOW = datetime.timedelta(minutes=10)
+MOVING_INTERVAL = datetime.timedelta(minutes=5)
+MAX_CHARGING_INTERVAL = datetime.timedelta(minutes=30)
+
+
+def _last_online(car: dict):
+    telematics = car.get("telematics", [{}])[0]
+    return telematics.get("last_online", car.get("last_online"))
+
+
 class ElectroCarsCoordinator(DataUpdateCoordinator):
     """Coordinator to manage fetching data from ElectroCars API."""
 
@@ -21,20 +49,55 @@ class ElectroCarsCoordinator(DataUpdateCoordinator):
         )
         self.api = api
         self.data = []
+        self._failures = 0
+        self._last_online: dict[str, object] = {}
+        # (timestamp, battery) samples per charging car
+        self._charge_samples: dict[str, deque[tuple[float, float]]] = {}
+        # When moving or ignition last flipped on, per car
+        self._trip_started: dict[str, datetime.datetime] = {}
+        self.circuit_open = False
+        # Interval chosen by the normal polling ladder, the breaker never polls faster than this
+        self._ladder_interval = self.update_interval
+        # True while the last snapshot is served because the API is unreachable
+        self.stale = False
+        # Cars whose last_online did not move since the previous refresh
+        self.stale_cars: set[str] = set()
 
     async def _async_update_data(self):
         """Fetch data from ElectroCars API and adjust update interval."""
-        cars = await self.api.get_cars()
+        try:
+            cars = await self.api.get_cars()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError) as err:
+            _LOGGER.warning("Error fetching cars: %s", err)
+            cars = None
+
+        if cars is None:
+            return self._handle_failure()
+
+        if self.circuit_open:
+            _LOGGER.info("ElectroCars API is reachable again, closing circuit breaker")
+        self._failures = 0
+        self.circuit_open = False
+        self.stale = False
+        self._update_stale_cars(cars)
+
         if cars:
             self.data = cars
 
-            any_moving = any(car.get("telematics", [{}])[0].get("moving") for car in cars)
-            any_charging = any(car.get("telematics", [{}])[0].get("charging") for car in cars)
+            # Cars with frozen telematics don't drive polling until they report again
+            fresh = [car for car in cars if str(car["id"]) not in self.stale_cars]
+            any_charging = any(car.get("telematics", [{}])[0].get("charging") for car in fresh)
 
             now = datetime.datetime.now(datetime.timezone.utc)
-            if any_moving or any_charging:
-                # If moving or charging, update every 5 minutes
-                new_interval = datetime.timedelta(minutes=5)
+            moving_interval = self._moving_interval(fresh, now)
+            charging_interval = self._predict_charging_interval(fresh)
+            if moving_interval:
+                # The end of a trip can't be predicted, poll by how long the trip has lasted
+                new_interval = min(moving_interval, charging_interval or moving_interval)
+                self._last_active = now
+            elif any_charging:
+                # Poll around the moment the next charge threshold is expected
+                new_interval = charging_interval or datetime.timedelta(minutes=5)
                 self._last_active = now
             else:
                 # If stopped for more than 10 minutes, switch to 1 hour
@@ -44,7 +107,94 @@ class ElectroCarsCoordinator(DataUpdateCoordinator):
                 else:
                     new_interval = datetime.timedelta(minutes=10)
 
+            self._ladder_interval = new_interval
             if self.update_interval != new_interval:
                 self.update_interval = new_interval
 
-        return self.data
\ No newline at end of file
+        return self.data
+
+    def _handle_failure(self):
+        """Serve the last snapshot and back off while the API keeps failing."""
+        self._failures += 1
+        if not self.data:
+            raise UpdateFailed("Failed to fetch cars from ElectroCars API")
+
+        self.stale = True
+        self.stale_cars = {str(car["id"]) for car in self.data}
+        if self._failures >= BREAKER_FAILURE_THRESHOLD:
+            if not self.circuit_open:
+                _LOGGER.warning(
+                    "ElectroCars API failed %d times in a row, opening circuit breaker", self._failures
+                )
+            self.circuit_open = True
+            backoff = BREAKER_BASE_BACKOFF * 2 ** (self._failures - BREAKER_FAILURE_THRESHOLD)
+            self.update_interval = max(self._ladder_interval, min(backoff, BREAKER_MAX_BACKOFF))
+        return self.data
+
+    def _update_stale_cars(self, cars: list) -> None:
+        """Mark cars whose last_online has not changed since the previous refresh."""
+        last_online = {str(car["id"]): _last_online(car) for car in cars}
+        self.stale_cars = {
+            car_id
+            for car_id, value in last_online.items()
+            if value is not None and self._last_online.get(car_id) == value
+        }
+        self._last_online = last_online
+
+    def _moving_interval(self, cars: list, now: datetime.datetime) -> datetime.timedelta | None:
+        """Poll every minute right after a trip starts and back off while it goes on."""
+        intervals = []
+        for car in cars:
+            car_id = str(car["id"])
+            telematics = car.get("telematics", [{}])[0]
+            if not (telematics.get("moving") or telematics.get("ignition")):
+                self._trip_started.pop(car_id, None)
+                continue
+            started = self._trip_started.setdefault(car_id, now)
+            intervals.append(MIN_INTERVAL if now - started < TRIP_START_WINDOW else MOVING_INTERVAL)
+        return min(intervals, default=None)
+
+    def _predict_charging_interval(self, cars: list) -> datetime.timedelta | None:
+        """Estimate when the next charging car reaches a charge threshold."""
+        predictions = []
+        now = time.time()
+        for car in cars:
+            car_id = str(car["id"])
+            telematics = car.get("telematics", [{}])[0]
+            battery = telematics.get("battery", car.get("battery"))
+            if not telematics.get("charging") or battery is None:
+                self._charge_samples.pop(car_id, None)
+                continue
+
+            samples = self._charge_samples.setdefault(car_id, deque(maxlen=CHARGE_SAMPLES))
+            sampled_at = _last_online(car) or now
+            if not samples or samples[-1][0] < sampled_at:
+                samples.append((sampled_at, float(battery)))
+
+            rate = self._charge_rate(samples, telematics.get("battery_capacity", car.get("battery_capacity")))
+            last_at, last_battery = samples[-1]
+            target = next((level for level in CHARGE_THRESHOLDS if level > last_battery), None)
+            if not rate or target is None:
+                continue
+            # Count from now, the last sample may already be old
+            remaining = (target - last_battery) / rate - (now - last_at)
+            predictions.append(datetime.timedelta(seconds=max(remaining, 0)))
+
+        if not predictions:
+            return None
+        return max(MIN_INTERVAL, min(min(predictions), MAX_CHARGING_INTERVAL))
+
+    @staticmethod
+    def _charge_rate(samples: deque, capacity) -> float | None:
+        """Return the SoC rate in %/s from the collected samples."""
+        if len(samples) < 2:
+            return None
+        (first_at, first_battery), (last_at, last_battery) = samples[0], samples[-1]
+        elapsed = last_at - first_at
+        if elapsed <= 0:
+            return None
+        # SoC is reported in whole percents, no change means less than 1% over the window
+        rate = max(last_battery - first_battery, 1) / elapsed
+        if capacity:
+            rate = min(rate, MAX_CHARGING_POWER_KW / float(capacity) * 100 / 3600)
+        return rate
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .coordinator import ElectroCarsCoordinator
 from .const import DOMAIN
+from .entity import ElectroCarEntity
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator: ElectroCarsCoordinator = hass.data[DOMAIN][config_entry.entry_id]
@@ -15,7 +15,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     async_add_entities(entities)
 
-class ElectroCarTrackerEntity(CoordinatorEntity, TrackerEntity):
+class ElectroCarTrackerEntity(ElectroCarEntity, TrackerEntity):
     def __init__(self, coordinator: ElectroCarsCoordinator, car_id: str) -> None:
         super().__init__(coordinator)
         self.car_id = car_id
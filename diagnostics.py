@@ -0,0 +1,26 @@
+"""Diagnostics support for Electro Cars integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ElectroCarsCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ElectroCarsCoordinator = hass.data[DOMAIN][entry.entry_id]
+    decode_duration = coordinator.api.last_decode_duration
+    return {
+        "cars": len(coordinator.data or []),
+        "circuit_open": coordinator.circuit_open,
+        "stale": coordinator.stale,
+        "stale_cars": sorted(coordinator.stale_cars),
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        # Time spent decoding the last /car payload, on or off the event loop
+        "last_decode_duration_ms": round(decode_duration * 1000, 3) if decode_duration is not None else None,
+    }
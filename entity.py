@@ -0,0 +1,37 @@
+"""Base entity for Electro Cars integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ElectroCarsCoordinator
+
+
+class ElectroCarEntity(CoordinatorEntity[ElectroCarsCoordinator]):
+    """Coordinator entity bound to a single car."""
+
+    car_id: str
+    # (available, stale) as of the last state write
+    _written_status: tuple[bool, bool] | None = None
+    _skip_when_stale = True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Flag data served from the last snapshot while the API is unreachable."""
+        return {"stale": self.coordinator.stale}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the state write when the car has no new data and its status is unchanged."""
+        status = (self.available, self.coordinator.stale)
+        if (
+            self._skip_when_stale
+            and self.car_id in self.coordinator.stale_cars
+            and status == self._written_status
+        ):
+            return
+        self._written_status = status
+        super()._handle_coordinator_update()
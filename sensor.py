@@ -3,7 +3,6 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import EntityCategory
@@ -12,6 +11,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import ElectroCarsCoordinator
+from .entity import ElectroCarEntity
 from .util import build_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ async def async_setup_entry(
         for description in SENSOR_TYPES:
             # Try telematics first, then fallback to main car data
             value = telematics.get(description.key, car.get(description.key))
-            if value is not None:
+            if value is not None or description.key == "update_interval":
                 entities.append(ElectroCarSensor(
                     coordinator=coordinator,
                     car_id=car_id,
@@ -61,7 +61,7 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
-class ElectroCarSensor(CoordinatorEntity, SensorEntity):
+class ElectroCarSensor(ElectroCarEntity, SensorEntity):
     def __init__(self, coordinator: ElectroCarsCoordinator, car_id, description, device_info):
         super().__init__(coordinator)
         self.coordinator = coordinator
@@ -70,6 +70,8 @@ class ElectroCarSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = description.name
         self._attr_unique_id = f"{car_id}_{description.key}"
         self._attr_device_info = device_info
+        # The update interval belongs to the coordinator, it changes even when the car has no new data
+        self._skip_when_stale = description.key != "update_interval"
 
     @property
     def icon(self) -> str | None:
@@ -82,6 +84,14 @@ class ElectroCarSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
+        if self.entity_description.key == "update_interval":
+            interval = self.coordinator.update_interval
+            if interval:
+                minutes = max(1, round(interval.total_seconds() / 60))
+                if minutes % 60 == 0:
+                    return f"{minutes // 60} ч"
+                return f"{minutes} мин"
+            return "Неизвестно"
         car = next((car for car in self.coordinator.data if str(car["id"]) == self.car_id), None)
         if car:
             telematics = car.get("telematics", [{}])[0]
@@ -105,14 +115,4 @@ class ElectroCarSensor(CoordinatorEntity, SensorEntity):
                 return local_dt.strftime("%Y-%m-%d %H:%M:%S")
 
             return value
-        if self.entity_description.key == "update_interval":
-            interval = self.coordinator.update_interval
-            if interval:
-                seconds = interval.total_seconds()
-                if seconds <= 300:
-                    return "5 минут"
-                if seconds <= 600:
-                    return "10 минут"
-                return "1 час"
-            return "Неизвестно"
         return None
\ No newline at end of file
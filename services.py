@@ -0,0 +1,142 @@
+"""Services for Electro Cars integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import async_timeout
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+from .coordinator import ElectroCarsCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_SEND_COMMAND = "send_command"
+
+ATTR_COMMAND = "command"
+ATTR_IMEI = "imei"
+ATTR_DEVICE_ID = "device_id"
+ATTR_AREA_ID = "area_id"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_TIMEOUT = "timeout"
+
+DEFAULT_MAX_PARALLEL = 10
+DEFAULT_TIMEOUT = 20
+
+SEND_COMMAND_SCHEMA = vol.All(
+    cv.has_at_least_one_key(ATTR_IMEI, ATTR_DEVICE_ID, ATTR_AREA_ID),
+    vol.Schema(
+        {
+            vol.Required(ATTR_COMMAND): vol.Coerce(int),
+            vol.Optional(ATTR_IMEI, default=[]): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_DEVICE_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_AREA_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_MAX_PARALLEL, default=DEFAULT_MAX_PARALLEL): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=50)
+            ),
+            vol.Optional(ATTR_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=120)
+            ),
+        }
+    ),
+)
+
+
+def _car_imei(car: dict) -> str | None:
+    telematics = car.get("telematics")
+    if not telematics or not telematics[0].get("imei"):
+        return None
+    return str(telematics[0]["imei"])
+
+
+def _resolve_targets(hass: HomeAssistant, call: ServiceCall) -> dict[str, ElectroCarsCoordinator]:
+    """Map every targeted IMEI to the coordinator whose API can reach it."""
+    coordinators: dict[str, ElectroCarsCoordinator] = hass.data.get(DOMAIN, {})
+    car_ids: set[str] = set()
+
+    device_registry = dr.async_get(hass)
+    devices = []
+    for device_id in call.data[ATTR_DEVICE_ID]:
+        device = device_registry.async_get(device_id)
+        if device is None:
+            _LOGGER.warning("Unknown device %s, skipping", device_id)
+            continue
+        devices.append(device)
+    for area_id in call.data[ATTR_AREA_ID]:
+        devices.extend(dr.async_entries_for_area(device_registry, area_id))
+    for device in devices:
+        car_ids.update(value for domain, value in device.identifiers if domain == DOMAIN)
+
+    wanted_imeis = set(call.data[ATTR_IMEI])
+    targets: dict[str, ElectroCarsCoordinator] = {}
+    for coordinator in coordinators.values():
+        for car in coordinator.data or []:
+            imei = _car_imei(car)
+            if imei and (imei in wanted_imeis or str(car["id"]) in car_ids):
+                targets[imei] = coordinator
+
+    for imei in wanted_imeis - targets.keys():
+        _LOGGER.warning("Unknown IMEI %s, skipping", imei)
+    if not targets:
+        raise ServiceValidationError("No Electro Cars vehicles match the given targets")
+    return targets
+
+
+async def _async_handle_send_command(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send one command to many cars concurrently and collect the results."""
+    command = call.data[ATTR_COMMAND]
+    timeout = call.data[ATTR_TIMEOUT]
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_PARALLEL])
+    targets = _resolve_targets(hass, call)
+
+    async def _send(imei: str, coordinator: ElectroCarsCoordinator) -> dict:
+        async with semaphore:
+            try:
+                # The timeout covers the whole attempt, including a token refresh and the retry
+                async with async_timeout.timeout(timeout):
+                    success = await coordinator.api.send_command(imei, command, timeout=timeout)
+            except asyncio.TimeoutError:
+                return {"imei": imei, "success": False, "error": "timeout"}
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.error("Error sending command %s to device %s: %s", command, imei, err)
+                return {"imei": imei, "success": False, "error": str(err) or type(err).__name__}
+        if not success:
+            return {"imei": imei, "success": False, "error": "rejected"}
+        return {"imei": imei, "success": True}
+
+    results = await asyncio.gather(
+        *(_send(imei, coordinator) for imei, coordinator in targets.items())
+    )
+    succeeded = sum(1 for result in results if result["success"])
+    _LOGGER.info(
+        "Command %s sent to %d cars: %d succeeded, %d failed",
+        command, len(results), succeeded, len(results) - succeeded,
+    )
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": list(results),
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def handle_send_command(call: ServiceCall) -> ServiceResponse:
+        return await _async_handle_send_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMAND,
+        handle_send_command,
+        schema=SEND_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
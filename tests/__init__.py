@@ -0,0 +1 @@
+"""Tests for the Electro Cars integration."""
@@ -0,0 +1,139 @@
+"""Fixtures for Electro Cars tests."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+# The repository root is the integration itself, expose it as custom_components.electrocars
+_ROOT = Path(tempfile.mkdtemp(prefix="electrocars-tests-"))
+(_ROOT / "custom_components").mkdir()
+(_ROOT / "custom_components" / "__init__.py").touch()
+(_ROOT / "custom_components" / "electrocars").symlink_to(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, str(_ROOT))
+
+from custom_components.electrocars.const import DOMAIN  # noqa: E402
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the temporary custom_components tree, the symlink itself, not its target."""
+    shutil.rmtree(_ROOT, ignore_errors=True)
+
+
+def make_car(car_id: int, imei: str) -> dict:
+    return {
+        "id": car_id,
+        "brand": {"name": "Evolute"},
+        "model": {"name": "i-PRO"},
+        "modification": {"name": "Standard"},
+        "numberplate": f"A{car_id:03d}AA",
+        "vin": f"VIN{car_id:014d}",
+        "telematics": [
+            {
+                "imei": imei,
+                "battery": 80,
+                "power_reserve": 300,
+                "lat": 55.75,
+                "lng": 37.61,
+                "last_online": 1700000000 + car_id,
+                "charging": False,
+                "moving": False,
+                "locked": 0,
+                "door_fl": False,
+            }
+        ],
+    }
+
+
+class StubFleetAPI:
+    """Local stand-in for the auth gateway and fleet API."""
+
+    def __init__(self) -> None:
+        self.cars = [make_car(1, "860000000000001"), make_car(2, "860000000000002")]
+        self.cars_status = 200
+        self.refreshes = 0
+        self.commands: list[tuple[str, int]] = []
+        # Per-IMEI answer delay in seconds and response status for commands
+        self.command_delay: dict[str, float] = {}
+        self.command_status: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = web.Application()
+        self.app.router.add_post("/api/auth/refresh", self._refresh)
+        self.app.router.add_get("/car", self._cars)
+        self.app.router.add_get("/telematics/devices/{imei}/commands", self._get_commands)
+        self.app.router.add_post("/telematics/devices/{imei}/commands", self._send_command)
+
+    async def _refresh(self, request: web.Request) -> web.Response:
+        self.refreshes += 1
+        resp = web.json_response({"access_token": f"access-{self.refreshes}"})
+        resp.set_cookie("refresh_token", f"refresh-{self.refreshes}")
+        return resp
+
+    async def _cars(self, request: web.Request) -> web.Response:
+        if self.cars_status != 200:
+            return web.Response(status=self.cars_status, text="unavailable")
+        return web.json_response({"result": {"items": self.cars}})
+
+    async def _get_commands(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"result": [{"command": 1, "title": "Закрыть", "fleet_view_group": 0, "reverse": 2}]}
+        )
+
+    async def _send_command(self, request: web.Request) -> web.Response:
+        imei = request.match_info["imei"]
+        data = await request.json()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.command_delay.get(imei, 0.01))
+        finally:
+            self.in_flight -= 1
+        status = self.command_status.get(imei, 200)
+        if status != 200:
+            return web.Response(status=status, text="device offline")
+        self.commands.append((imei, data["command"]))
+        return web.json_response({})
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the integration in every test."""
+    yield
+
+
+@pytest.fixture
+async def stub_api(socket_enabled):
+    """Serve the stub API locally and point the integration at it."""
+    api = StubFleetAPI()
+    server = TestServer(api.app, host="127.0.0.1")
+    await server.start_server()
+    base = str(server.make_url("")).rstrip("/")
+    with patch("custom_components.electrocars.api.AUTH_BASE", f"{base}/api/auth"), patch(
+        "custom_components.electrocars.api.FLEET_BASE", base
+    ):
+        yield api
+    await server.close()
+
+
+@pytest.fixture
+def config_entry(hass) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Electro Cars",
+        data={"phone": "79000000000", "refresh_token": "refresh-0"},
+    )
+    entry.add_to_hass(hass)
+    return entry
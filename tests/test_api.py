@@ -0,0 +1,85 @@
+"""Tests for the Electro Cars API client."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.electrocars import api
+from custom_components.electrocars.api import ElectroCarsAPI, decode_cars
+from custom_components.electrocars.const import DOMAIN
+from custom_components.electrocars.diagnostics import async_get_config_entry_diagnostics
+
+from .conftest import make_car
+
+
+def _payload(*cars: dict) -> bytes:
+    return json.dumps({"result": {"items": list(cars)}}).encode()
+
+
+def test_decode_cars_projects_fields() -> None:
+    """Unused fields are dropped, entity keys are kept at both levels."""
+    car = make_car(1, "860000000000001")
+    car["unused"] = {"big": "x" * 100}
+    car["gsm_level"] = 70
+    car["telematics"][0]["unused"] = 1
+    car["telematics"].append({"imei": "second"})
+
+    (projected,) = decode_cars(_payload(car))
+
+    assert "unused" not in projected
+    assert projected["gsm_level"] == 70
+    assert projected["brand"] == {"name": "Evolute"}
+    assert projected["vin"] == car["vin"]
+    assert len(projected["telematics"]) == 1
+    assert "unused" not in projected["telematics"][0]
+    assert projected["telematics"][0]["imei"] == "860000000000001"
+    assert projected["telematics"][0]["lat"] == 55.75
+
+
+def test_decode_cars_without_telematics() -> None:
+    """Cars with missing or empty telematics decode without it."""
+    missing = make_car(1, "1")
+    del missing["telematics"]
+    empty = make_car(2, "2")
+    empty["telematics"] = []
+
+    cars = decode_cars(_payload(missing, empty))
+
+    assert [car.get("telematics") for car in cars] == [None, None]
+    assert [car["id"] for car in cars] == [1, 2]
+
+
+async def test_large_payload_decoded_in_executor(hass: HomeAssistant) -> None:
+    """Payloads above the threshold are decoded off the event loop."""
+    client = ElectroCarsAPI()
+    client._hass = hass
+    raw = _payload(make_car(1, "1"), make_car(2, "2"))
+
+    with patch.object(hass, "async_add_executor_job", wraps=hass.async_add_executor_job) as executor:
+        with patch.object(api, "EXECUTOR_DECODE_THRESHOLD", len(raw)):
+            assert len(await client._decode_cars(raw)) == 2
+        executor.assert_not_called()
+
+        with patch.object(api, "EXECUTOR_DECODE_THRESHOLD", len(raw) - 1):
+            assert len(await client._decode_cars(raw)) == 2
+        executor.assert_called_once()
+
+    assert client.last_decode_duration is not None
+
+
+async def test_diagnostics_report_decode_duration(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """The last decode time is exposed through diagnostics."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["cars"] == 2
+    assert diagnostics["last_decode_duration_ms"] >= 0
+    assert diagnostics["update_interval"] == hass.data[DOMAIN][config_entry.entry_id].update_interval.total_seconds()
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
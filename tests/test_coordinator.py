@@ -0,0 +1,230 @@
+"""Tests for the Electro Cars coordinator."""
+
+from __future__ import annotations
+
+import datetime
+import time
+from collections import deque
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.electrocars.const import DOMAIN
+from custom_components.electrocars.coordinator import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+    MAX_CHARGING_INTERVAL,
+    MIN_INTERVAL,
+    MOVING_INTERVAL,
+    TRIP_START_WINDOW,
+    ElectroCarsCoordinator,
+)
+
+from .conftest import make_car
+
+
+class FakeAPI:
+    """Return queued get_cars results, None meaning a failed fetch."""
+
+    def __init__(self) -> None:
+        self.results: list = []
+
+    async def get_cars(self):
+        return self.results.pop(0)
+
+
+def _coordinator(hass: HomeAssistant) -> tuple[ElectroCarsCoordinator, FakeAPI]:
+    api = FakeAPI()
+    return ElectroCarsCoordinator(hass, api), api
+
+
+async def _refresh(coordinator: ElectroCarsCoordinator, api: FakeAPI, result) -> None:
+    api.results.append(result)
+    await coordinator._async_update_data()
+
+
+def _moving_car() -> dict:
+    car = make_car(1, "1")
+    car["telematics"][0]["moving"] = True
+    return car
+
+
+async def test_breaker_opens_after_threshold(hass: HomeAssistant) -> None:
+    coordinator, api = _coordinator(hass)
+    await _refresh(coordinator, api, [make_car(1, "1")])
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        await _refresh(coordinator, api, None)
+        assert coordinator.stale
+        assert not coordinator.circuit_open
+    await _refresh(coordinator, api, None)
+
+    assert coordinator.circuit_open
+    # The last snapshot is still served
+    assert coordinator.data[0]["id"] == 1
+    assert coordinator.stale_cars == {"1"}
+
+
+async def test_breaker_backoff_doubles_up_to_cap(hass: HomeAssistant) -> None:
+    coordinator, api = _coordinator(hass)
+    # A moving car keeps the normal interval at a minute, below every backoff step
+    await _refresh(coordinator, api, [_moving_car()])
+    assert coordinator.update_interval == MIN_INTERVAL
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        await _refresh(coordinator, api, None)
+    intervals = []
+    for _ in range(7):
+        await _refresh(coordinator, api, None)
+        intervals.append(coordinator.update_interval)
+
+    assert intervals[:5] == [BREAKER_BASE_BACKOFF * 2**step for step in range(5)]
+    assert intervals[-1] == BREAKER_MAX_BACKOFF
+
+
+async def test_breaker_never_polls_faster_than_ladder(hass: HomeAssistant) -> None:
+    coordinator, api = _coordinator(hass)
+    coordinator._last_active -= datetime.timedelta(hours=2)
+    await _refresh(coordinator, api, [make_car(1, "1")])
+    assert coordinator.update_interval == datetime.timedelta(hours=1)
+
+    for _ in range(BREAKER_FAILURE_THRESHOLD + 2):
+        await _refresh(coordinator, api, None)
+        assert coordinator.update_interval == datetime.timedelta(hours=1)
+    assert coordinator.circuit_open
+
+
+async def test_breaker_closes_on_first_success(hass: HomeAssistant) -> None:
+    coordinator, api = _coordinator(hass)
+    await _refresh(coordinator, api, [_moving_car()])
+    for _ in range(BREAKER_FAILURE_THRESHOLD + 1):
+        await _refresh(coordinator, api, None)
+    assert coordinator.circuit_open
+
+    car = _moving_car()
+    car["telematics"][0]["last_online"] += 60
+    await _refresh(coordinator, api, [car])
+
+    assert not coordinator.circuit_open
+    assert not coordinator.stale
+    assert coordinator.stale_cars == set()
+    assert coordinator.update_interval == MIN_INTERVAL
+
+
+async def test_entities_recover_after_failed_refresh(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """A parked car marked unavailable comes back although its last_online didn't move."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: ElectroCarsCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, "1_battery")
+
+    with patch.object(coordinator.api, "get_cars", side_effect=RuntimeError("boom")):
+        await coordinator.async_refresh()
+    assert hass.states.get(entity_id).state == "unavailable"
+
+    await coordinator.async_refresh()
+    assert "1" in coordinator.stale_cars
+    assert hass.states.get(entity_id).state == "80"
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_entities_flag_stale_snapshot(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """During an outage entities stay available and expose the stale flag."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: ElectroCarsCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", DOMAIN, "1_battery")
+    assert hass.states.get(entity_id).attributes["stale"] is False
+
+    stub_api.cars_status = 503
+    await coordinator.async_refresh()
+    state = hass.states.get(entity_id)
+    assert state.state == "80"
+    assert state.attributes["stale"] is True
+
+    stub_api.cars_status = 200
+    await coordinator.async_refresh()
+    assert hass.states.get(entity_id).attributes["stale"] is False
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def _charging_car(battery: int, last_online: float, capacity: float = 60) -> dict:
+    car = make_car(1, "1")
+    car["telematics"][0].update(
+        charging=True, battery=battery, last_online=last_online, battery_capacity=capacity
+    )
+    return car
+
+
+def test_charge_rate_is_capped_by_capacity() -> None:
+    # 2% in 10 minutes, well under the cap
+    assert ElectroCarsCoordinator._charge_rate(deque([(0, 50), (600, 52)]), 60) == 2 / 600
+    # 30% in a minute on a 10 kWh pack would need 180 kW, the cap is 150 kW
+    capped = ElectroCarsCoordinator._charge_rate(deque([(0, 50), (60, 80)]), 10)
+    assert capped == 150 / 10 * 100 / 3600
+    # An unchanged whole-percent SoC counts as less than 1% over the window
+    assert ElectroCarsCoordinator._charge_rate(deque([(0, 50), (600, 50)]), None) == 1 / 600
+    assert ElectroCarsCoordinator._charge_rate(deque([(0, 50)]), 60) is None
+
+
+async def test_charge_prediction_targets_and_clamp(hass: HomeAssistant) -> None:
+    coordinator, _ = _coordinator(hass)
+    now = time.time()
+
+    def predict(start: int, end: int, elapsed: float) -> datetime.timedelta | None:
+        coordinator._charge_samples.clear()
+        with patch("custom_components.electrocars.coordinator.time.time", return_value=now):
+            coordinator._predict_charging_interval([_charging_car(start, now - elapsed)])
+            return coordinator._predict_charging_interval([_charging_car(end, now)])
+
+    # 1% per 5 minutes, 79 → 80 in five minutes
+    assert predict(78, 79, 300) == datetime.timedelta(minutes=5)
+    # Past 80 the next target is 100: 5% left at 1% per minute
+    assert predict(94, 95, 60) == datetime.timedelta(minutes=5)
+    # Slow charging far from the target is clamped to 30 minutes
+    assert predict(50, 51, 600) == MAX_CHARGING_INTERVAL
+    # Fast charging right below the target is clamped to a minute
+    assert predict(78, 79, 10) == MIN_INTERVAL
+    # Nothing left to reach
+    assert predict(99, 100, 600) is None
+
+
+async def test_trip_start_window(hass: HomeAssistant) -> None:
+    coordinator, _ = _coordinator(hass)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    car = _moving_car()
+
+    assert coordinator._moving_interval([car], now) == MIN_INTERVAL
+    assert coordinator._moving_interval([car], now + TRIP_START_WINDOW) == MOVING_INTERVAL
+    car["telematics"][0]["moving"] = False
+    assert coordinator._moving_interval([car], now + TRIP_START_WINDOW) is None
+    assert "1" not in coordinator._trip_started
+
+
+async def test_frozen_telematics_fall_back_to_ladder(hass: HomeAssistant) -> None:
+    """A charging or moving car whose last_online stops moving doesn't keep polling fast."""
+    coordinator, api = _coordinator(hass)
+    now = time.time()
+    await _refresh(coordinator, api, [_charging_car(50, now - 300)])
+    await _refresh(coordinator, api, [_charging_car(52, now)])
+    assert coordinator.update_interval == MAX_CHARGING_INTERVAL
+
+    # Telematics freeze, the predicted threshold time passes without a new sample
+    with patch("custom_components.electrocars.coordinator.time.time", return_value=now + 3600):
+        for _ in range(3):
+            await _refresh(coordinator, api, [_charging_car(52, now)])
+            assert coordinator.stale_cars == {"1"}
+            assert coordinator.update_interval == datetime.timedelta(minutes=10)
+
+    moving = _moving_car()
+    await _refresh(coordinator, api, [moving])
+    assert coordinator.update_interval == MIN_INTERVAL
+    await _refresh(coordinator, api, [moving])
+    assert coordinator.update_interval == datetime.timedelta(minutes=10)
+
@@ -0,0 +1,165 @@
+"""Soak tests for the Electro Cars setup/unload lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+import tracemalloc
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import DATA_ENTITY_PLATFORM
+
+from custom_components.electrocars import const
+from custom_components.electrocars.const import DOMAIN
+
+_INTEGRATION_DIR = os.path.dirname(const.__file__)
+
+SOAK_CYCLES = int(os.environ.get("ELECTROCARS_SOAK_CYCLES", "1000"))
+WARMUP_CYCLES = 20
+# Home Assistant 2024.3 resets but never destroys entity platforms on config entry unload and keeps
+# them registered forever. Only work around it there, other releases must not hide real leaks.
+_KEEPS_UNLOADED_PLATFORMS = (MAJOR_VERSION, MINOR_VERSION) == (2024, 3)
+# Allowed heap growth over the whole soak run, covers Home Assistant's transient allocations
+MAX_MEMORY_GROWTH = 1024 * 1024
+
+
+def _open_sessions() -> int:
+    gc.collect()
+    return sum(
+        1 for obj in gc.get_objects() if isinstance(obj, aiohttp.ClientSession) and not obj.closed
+    )
+
+
+def _live_objects() -> int:
+    """Count live instances of the integration's classes (API, coordinator, entities)."""
+    gc.collect()
+    return sum(
+        1
+        for obj in gc.get_objects()
+        if str(getattr(type(obj), "__module__", "")).startswith("custom_components.electrocars")
+    )
+
+
+def _listeners(hass: HomeAssistant) -> int:
+    return sum(hass.bus.async_listeners().values())
+
+
+def _tasks() -> int:
+    return len(asyncio.all_tasks())
+
+
+def _integration_tasks() -> int:
+    """Count pending tasks running code from this integration."""
+    return sum(
+        1
+        for task in asyncio.all_tasks()
+        if hasattr(task.get_coro(), "cr_code")
+        and os.path.dirname(task.get_coro().cr_code.co_filename) == _INTEGRATION_DIR
+    )
+
+
+async def _cycle(hass: HomeAssistant, entry) -> None:
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    if _KEEPS_UNLOADED_PLATFORMS:
+        # Drop the platforms Home Assistant keeps around so the heap check only sees this integration
+        platforms = hass.data.get(DATA_ENTITY_PLATFORM, {}).get(DOMAIN, [])
+        platforms[:] = [platform for platform in platforms if platform.config_entry.state is ConfigEntryState.LOADED]
+
+
+async def test_setup_unload_soak(hass: HomeAssistant, stub_api, config_entry, caplog) -> None:
+    """Repeated setup/unload leaves sessions, tasks, listeners and memory flat."""
+    # Captured log records would otherwise pile up and count as heap growth
+    caplog.set_level(logging.WARNING)
+    for _ in range(WARMUP_CYCLES):
+        await _cycle(hass, config_entry)
+
+    tasks, listeners = _tasks(), _listeners(hass)
+    assert _open_sessions() == 0
+    assert _live_objects() == 0
+    assert not hass.data[DOMAIN]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(SOAK_CYCLES):
+            await _cycle(hass, config_entry)
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert _open_sessions() == 0
+    assert _live_objects() == 0
+    # Home Assistant's own tasks and delayed-save listeners come and go, they only must not pile up
+    assert _integration_tasks() == 0
+    assert _tasks() <= tasks
+    assert _listeners(hass) <= listeners
+    assert not hass.data[DOMAIN]
+    assert growth < MAX_MEMORY_GROWTH, f"heap grew by {growth} bytes over {SOAK_CYCLES} cycles"
+
+
+async def test_unload_removes_all_platforms(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """Every forwarded platform, buttons included, is unloaded with the entry."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.async_entity_ids("button")
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entries = er.async_entries_for_config_entry(er.async_get(hass), config_entry.entry_id)
+    assert {entry.domain for entry in entries} == {"sensor", "binary_sensor", "device_tracker", "button"}
+    for entry in entries:
+        assert hass.states.get(entry.entity_id).state == "unavailable"
+
+
+async def test_failed_setup_closes_session(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """A setup retried because the API is down doesn't leak its session."""
+    stub_api.cars_status = 503
+    for _ in range(WARMUP_CYCLES):
+        assert not await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert config_entry.state is ConfigEntryState.SETUP_RETRY
+        await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert _open_sessions() == 0
+    assert DOMAIN not in hass.data or not hass.data[DOMAIN]
+
+
+async def test_refresh_token_saved_on_entry(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """The rotated refresh token is stored on the entry during setup."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.data["refresh_token"] == f"refresh-{stub_api.refreshes}"
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_reload_keeps_single_coordinator(hass: HomeAssistant, stub_api, config_entry) -> None:
+    """Reloading replaces the coordinator instead of stacking them."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    for _ in range(WARMUP_CYCLES):
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert list(hass.data[DOMAIN]) == [config_entry.entry_id]
+    assert _open_sessions() == 1
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert _open_sessions() == 0
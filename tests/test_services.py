@@ -0,0 +1,97 @@
+"""Tests for the Electro Cars services."""
+
+from __future__ import annotations
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.electrocars.const import DOMAIN
+from custom_components.electrocars.services import SERVICE_SEND_COMMAND
+
+from .conftest import make_car
+
+IMEI_1 = "860000000000001"
+IMEI_2 = "860000000000002"
+
+
+@pytest.fixture
+async def loaded_entry(hass: HomeAssistant, stub_api, config_entry):
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield config_entry
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _send(hass: HomeAssistant, **data) -> dict:
+    return await hass.services.async_call(
+        DOMAIN, SERVICE_SEND_COMMAND, {"command": 1, **data}, blocking=True, return_response=True
+    )
+
+
+async def test_send_command_by_imei(hass: HomeAssistant, stub_api, loaded_entry) -> None:
+    response = await _send(hass, imei=IMEI_1)
+
+    assert stub_api.commands == [(IMEI_1, 1)]
+    assert response == {"succeeded": 1, "failed": 0, "results": [{"imei": IMEI_1, "success": True}]}
+
+
+async def test_send_command_by_device_and_area(hass: HomeAssistant, stub_api, loaded_entry) -> None:
+    device_registry = dr.async_get(hass)
+    first = device_registry.async_get_device(identifiers={(DOMAIN, "1")})
+    second = device_registry.async_get_device(identifiers={(DOMAIN, "2")})
+    garage = ar.async_get(hass).async_create("Garage")
+    device_registry.async_update_device(second.id, area_id=garage.id)
+
+    response = await _send(hass, device_id=first.id, area_id=garage.id)
+
+    assert sorted(stub_api.commands) == [(IMEI_1, 1), (IMEI_2, 1)]
+    assert response["succeeded"] == 2
+
+
+async def test_send_command_bounded_parallelism(hass: HomeAssistant, stub_api, config_entry) -> None:
+    stub_api.cars = [make_car(car_id, f"86000000000{car_id:04d}") for car_id in range(1, 7)]
+    stub_api.command_delay = {car["telematics"][0]["imei"]: 0.05 for car in stub_api.cars}
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await _send(hass, imei=list(stub_api.command_delay), max_parallel=2)
+
+    assert response["succeeded"] == 6
+    assert stub_api.max_in_flight == 2
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_send_command_timeout_and_counts(hass: HomeAssistant, stub_api, loaded_entry) -> None:
+    stub_api.command_delay[IMEI_2] = 2
+
+    response = await _send(hass, imei=[IMEI_1, IMEI_2], timeout=1)
+
+    assert response["succeeded"] == 1
+    assert response["failed"] == 1
+    assert {"imei": IMEI_2, "success": False, "error": "timeout"} in response["results"]
+
+
+async def test_offline_unit_refreshes_token_once(hass: HomeAssistant, stub_api, loaded_entry) -> None:
+    """A unit that keeps answering 500 gets one refresh and one retry, not a loop."""
+    stub_api.command_status[IMEI_1] = 500
+    refreshes = stub_api.refreshes
+
+    response = await _send(hass, imei=IMEI_1)
+
+    assert stub_api.refreshes == refreshes + 1
+    assert response["results"] == [{"imei": IMEI_1, "success": False, "error": "rejected"}]
+
+
+async def test_send_command_without_matches(hass: HomeAssistant, stub_api, loaded_entry) -> None:
+    with pytest.raises(ServiceValidationError):
+        await _send(hass, imei="000000000000000")
+    with pytest.raises(vol.Invalid):
+        await _send(hass)
@@ -2,6 +2,9 @@ from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN
 
+# Car fields read by build_device_info
+DEVICE_INFO_KEYS = ("id", "brand", "model", "modification", "numberplate", "vin")
+
 
 def build_device_info(car: dict) -> DeviceInfo:
     car_id = str(car["id"])